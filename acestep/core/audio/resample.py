@@ -0,0 +1,16 @@
+"""Cached resampling transforms."""
+
+from functools import lru_cache
+
+import torch
+import torchaudio
+
+
+@lru_cache(maxsize=16)
+def get_resampler(sr: int, target_sr: int, device: torch.device, dtype: torch.dtype) -> torchaudio.transforms.Resample:
+    """Return a cached Resample module so its sinc kernel is built once per (sr, device, dtype).
+
+    The kernel is built at torchaudio's default precision and then cast, so the
+    output is identical to an uncached ``Resample(sr, target_sr)`` as used in training.
+    """
+    return torchaudio.transforms.Resample(sr, target_sr).to(device=device, dtype=dtype)
@@ -0,0 +1,31 @@
+import unittest
+
+import torch
+import torchaudio
+
+from acestep.core.audio.resample import get_resampler
+
+
+class GetResamplerTests(unittest.TestCase):
+    def test_repeated_key_returns_cached_module(self):
+        device = torch.device("cpu")
+
+        first = get_resampler(44100, 48000, device, torch.float32)
+        second = get_resampler(44100, 48000, device, torch.float32)
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, get_resampler(22050, 48000, device, torch.float32))
+
+    def test_output_matches_uncached_resample(self):
+        torch.manual_seed(0)
+        for sr in (44100, 22050, 32000):
+            audio = torch.rand(2, sr // 10) * 2 - 1
+
+            expected = torchaudio.transforms.Resample(sr, 48000)(audio)
+            actual = get_resampler(sr, 48000, audio.device, audio.dtype)(audio)
+
+            self.assertTrue(torch.equal(actual, expected), f"mismatch for sr={sr}")
+
+
+if __name__ == "__main__":
+    unittest.main()
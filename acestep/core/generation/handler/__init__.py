@@ -1,6 +1,8 @@
 """Handler decomposition components."""
 
+from .inputs import InputsMixin
 from .lora_manager import LoraManagerMixin
 from .progress import ProgressMixin
+from .tensor_ops import TensorOpsMixin
 
-__all__ = ["LoraManagerMixin", "ProgressMixin"]
+__all__ = ["InputsMixin", "LoraManagerMixin", "ProgressMixin", "TensorOpsMixin"]
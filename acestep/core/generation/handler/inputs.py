@@ -0,0 +1,109 @@
+"""Metadata formatting and batch input normalization mixin for AceStepHandler."""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from acestep.constants import DEFAULT_DIT_INSTRUCTION
+
+META_TEMPLATE = (
+    "- bpm: %s\n"
+    "- timesignature: %s\n"
+    "- keyscale: %s\n"
+    "- duration: %s\n"
+)
+DEFAULT_META = META_TEMPLATE % ("N/A", "N/A", "N/A", "30 seconds")
+_NUMERIC = (int, float)
+
+
+@lru_cache(maxsize=256, typed=True)
+def format_meta_string(bpm: Any, timesignature: Any, keyscale: Any, duration: Any) -> str:
+    """Format metadata fields, cached so repeated metas across a batch format once."""
+    if isinstance(duration, _NUMERIC):
+        duration = f"{int(duration)} seconds"
+    elif not isinstance(duration, str):
+        duration = "30 seconds"
+    return META_TEMPLATE % (bpm, timesignature, keyscale, duration)
+
+
+def broadcast_to_batch(value: Optional[Union[str, List[Any]]], batch_size: int, default: Any) -> Sequence[Any]:
+    """Broadcast a scalar or list value to a sequence of length batch_size.
+
+    None becomes ``(default,) * batch_size``, a string or single-element list is
+    replicated into a tuple, and any other list is truncated or padded with
+    ``default`` into a new list. Callers must treat the result as read-only.
+    """
+    if value is None:
+        return (default,) * batch_size
+    if isinstance(value, str):
+        return (value,) * batch_size
+    n = len(value)
+    if n == 1:
+        return (value[0],) * batch_size
+    if n == batch_size:
+        return list(value)
+    # Pad or truncate to match batch_size
+    normalized = list(value[:batch_size])
+    normalized.extend([default] * (batch_size - len(normalized)))
+    return normalized
+
+
+class InputsMixin:
+    """Metadata and per-batch input normalization mixed into AceStepHandler."""
+
+    def _create_default_meta(self) -> str:
+        """Create default metadata string."""
+        return DEFAULT_META
+
+    def _dict_to_meta_string(self, meta_dict: Dict[str, Any]) -> str:
+        """Convert metadata dict to formatted string."""
+        # Probe primary keys first so fallback lookups only run on a miss
+        bpm = meta_dict['bpm'] if 'bpm' in meta_dict else meta_dict.get('tempo', 'N/A')
+        if 'timesignature' in meta_dict:
+            timesignature = meta_dict['timesignature']
+        else:
+            timesignature = meta_dict.get('time_signature', 'N/A')
+        if 'keyscale' in meta_dict:
+            keyscale = meta_dict['keyscale']
+        elif 'key' in meta_dict:
+            keyscale = meta_dict['key']
+        else:
+            keyscale = meta_dict.get('scale', 'N/A')
+        duration = meta_dict['duration'] if 'duration' in meta_dict else meta_dict.get('length', 30)
+
+        try:
+            return format_meta_string(bpm, timesignature, keyscale, duration)
+        except TypeError:
+            # Unhashable values cannot be cache keys; format them directly
+            return format_meta_string.__wrapped__(bpm, timesignature, keyscale, duration)
+
+    def _parse_metas(self, metas: List[Union[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Parse and normalize metadata with fallbacks.
+
+        Args:
+            metas: List of metadata (can be strings, dicts, or None)
+
+        Returns:
+            List of formatted metadata strings
+        """
+        # None and any other type fall back to the default metadata
+        default_meta = self._create_default_meta()
+        return [
+            meta if isinstance(meta, str)
+            else self._dict_to_meta_string(meta) if isinstance(meta, dict)
+            else default_meta
+            for meta in metas
+        ]
+
+    def _normalize_audio_code_hints(self, audio_code_hints: Optional[Union[str, List[str]]], batch_size: int) -> Sequence[Optional[str]]:
+        """Normalize audio_code_hints to a read-only sequence of correct length."""
+        # Clean up before broadcasting: convert empty strings to None
+        if isinstance(audio_code_hints, str):
+            audio_code_hints = audio_code_hints if audio_code_hints.strip() else None
+        elif audio_code_hints is not None:
+            audio_code_hints = [hint if isinstance(hint, str) and hint.strip() else None for hint in audio_code_hints]
+        return broadcast_to_batch(audio_code_hints, batch_size, None)
+
+    def _normalize_instructions(self, instructions: Optional[Union[str, List[str]]], batch_size: int, default: Optional[str] = None) -> Sequence[str]:
+        """Normalize instructions to a read-only sequence of correct length."""
+        return broadcast_to_batch(instructions, batch_size, default or DEFAULT_DIT_INSTRUCTION)
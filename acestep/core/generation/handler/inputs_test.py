@@ -0,0 +1,87 @@
+import unittest
+
+from acestep.constants import DEFAULT_DIT_INSTRUCTION
+from acestep.core.generation.handler.inputs import DEFAULT_META, InputsMixin, broadcast_to_batch
+
+
+class FakeHandler(InputsMixin):
+    pass
+
+
+class BroadcastToBatchTests(unittest.TestCase):
+    def test_none_replicates_default(self):
+        self.assertEqual(broadcast_to_batch(None, 3, "d"), ("d", "d", "d"))
+
+    def test_str_replicates_value(self):
+        self.assertEqual(broadcast_to_batch("x", 2, "d"), ("x", "x"))
+
+    def test_single_element_list_replicates_element(self):
+        self.assertEqual(broadcast_to_batch(["x"], 3, "d"), ("x", "x", "x"))
+
+    def test_matching_length_returns_new_list(self):
+        value = ["a", "b"]
+        result = broadcast_to_batch(value, 2, "d")
+
+        self.assertEqual(result, ["a", "b"])
+        self.assertIsNot(result, value)
+
+    def test_short_list_is_padded_with_default(self):
+        self.assertEqual(broadcast_to_batch(["a", "b"], 4, "d"), ["a", "b", "d", "d"])
+
+    def test_long_list_is_truncated(self):
+        self.assertEqual(broadcast_to_batch(["a", "b", "c"], 2, "d"), ["a", "b"])
+
+
+class NormalizeInputsTests(unittest.TestCase):
+    def setUp(self):
+        self.handler = FakeHandler()
+
+    def test_instructions_none_uses_default_instruction(self):
+        result = self.handler._normalize_instructions(None, 2)
+
+        self.assertEqual(list(result), [DEFAULT_DIT_INSTRUCTION] * 2)
+
+    def test_instructions_pad_with_given_default(self):
+        result = self.handler._normalize_instructions(["a", "b"], 3, "fallback:")
+
+        self.assertEqual(list(result), ["a", "b", "fallback:"])
+
+    def test_audio_code_hints_empty_string_becomes_none(self):
+        self.assertEqual(list(self.handler._normalize_audio_code_hints("  ", 2)), [None, None])
+        self.assertEqual(list(self.handler._normalize_audio_code_hints([""], 2)), [None, None])
+
+    def test_audio_code_hints_cleans_each_item_and_pads_with_none(self):
+        result = self.handler._normalize_audio_code_hints(["code", "", 3], 4)
+
+        self.assertEqual(list(result), ["code", None, None, None])
+
+    def test_audio_code_hints_none_and_single_value(self):
+        self.assertEqual(list(self.handler._normalize_audio_code_hints(None, 2)), [None, None])
+        self.assertEqual(list(self.handler._normalize_audio_code_hints("code", 2)), ["code", "code"])
+
+
+class ParseMetasTests(unittest.TestCase):
+    def setUp(self):
+        self.handler = FakeHandler()
+
+    def test_parse_metas_handles_each_type(self):
+        result = self.handler._parse_metas([None, "- bpm: 90\n", {"tempo": 120, "key": "C major", "length": 12.7}, 5])
+
+        self.assertEqual(result[0], DEFAULT_META)
+        self.assertEqual(result[1], "- bpm: 90\n")
+        self.assertEqual(
+            result[2],
+            "- bpm: 120\n- timesignature: N/A\n- keyscale: C major\n- duration: 12 seconds\n",
+        )
+        self.assertEqual(result[3], DEFAULT_META)
+
+    def test_int_and_float_bpm_are_not_conflated_by_cache(self):
+        self.assertIn("- bpm: 120\n", self.handler._dict_to_meta_string({"bpm": 120}))
+        self.assertIn("- bpm: 120.0\n", self.handler._dict_to_meta_string({"bpm": 120.0}))
+
+    def test_unhashable_values_are_formatted(self):
+        self.assertIn("- bpm: [1, 2]\n", self.handler._dict_to_meta_string({"bpm": [1, 2]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Tensor helper mixin for AceStepHandler."""
+
+import math
+from typing import List, Optional
+
+import torch
+
+
+class TensorOpsMixin:
+    """Audio and token tensor helpers mixed into AceStepHandler.
+
+    Expected host attributes:
+    - device
+    """
+
+    def is_silence(self, audio: torch.Tensor, threshold: float = 1e-6) -> bool:
+        """Return True if every sample is below threshold.
+
+        On CPU a cheap strided probe of ~64 samples catches most non-silent
+        audio first. Otherwise a single inf-norm reduction over the whole
+        tensor decides, fusing abs and max without materializing ``abs()``.
+        Accelerator tensors skip the probe so the common silent text2music
+        target costs exactly one device sync.
+        """
+        if audio.numel() == 0:
+            return True
+        # Compare as tensors so NaN counts as non-silent and the threshold is
+        # rounded to the audio dtype, as in a plain ``audio.abs() < threshold``
+        if audio.device.type == "cpu":
+            stride = max(audio.shape[-1] // 64, 1)
+            if not bool(self._abs_peak(audio[..., ::stride]) < threshold):
+                return False
+        return bool(self._abs_peak(audio) < threshold)
+
+    @staticmethod
+    def _abs_peak(audio: torch.Tensor) -> torch.Tensor:
+        """Max absolute value of a tensor as a 0-dim tensor."""
+        if audio.is_floating_point() or audio.is_complex():
+            return torch.linalg.vector_norm(audio, ord=math.inf)
+        # vector_norm rejects integer tensors
+        return audio.abs().amax()
+
+    def _pad_sequences(self, sequences: List[torch.Tensor], max_length: int, pad_value: Optional[int] = 0) -> torch.Tensor:
+        """Pad sequences to same length."""
+        if pad_value is None:
+            # Tokenizers without a pad token; F.pad treated None as 0
+            pad_value = 0
+        padded = torch.nn.utils.rnn.pad_sequence(sequences, batch_first=True, padding_value=pad_value)
+        if padded.shape[1] < max_length:
+            padded = torch.nn.functional.pad(padded, (0, max_length - padded.shape[1]), 'constant', pad_value)
+        elif padded.shape[1] > max_length:
+            padded = padded[:, :max_length]
+        # Pin CPU batches bound for CUDA so the later .to(device, non_blocking=True) is async
+        if (
+            padded.device.type == "cpu"
+            and isinstance(self.device, str) and self.device.startswith("cuda")
+            and torch.cuda.is_available()
+        ):
+            padded = padded.pin_memory()
+        return padded
@@ -0,0 +1,118 @@
+import unittest
+
+import torch
+
+from acestep.core.generation.handler.tensor_ops import TensorOpsMixin
+
+
+class FakeHandler(TensorOpsMixin):
+    def __init__(self, device="cpu"):
+        self.device = device
+
+
+def baseline_is_silence(audio):
+    return bool(torch.all(audio.abs() < 1e-6))
+
+
+def baseline_pad_sequences(sequences, max_length, pad_value=0):
+    return torch.stack([
+        torch.nn.functional.pad(seq, (0, max_length - len(seq)), 'constant', pad_value)
+        for seq in sequences
+    ])
+
+
+class IsSilenceTests(unittest.TestCase):
+    def setUp(self):
+        self.handler = FakeHandler()
+
+    def assertMatchesBaseline(self, audio, expected):
+        self.assertEqual(baseline_is_silence(audio), expected)
+        self.assertEqual(self.handler.is_silence(audio), expected)
+
+    def test_zeros_are_silent(self):
+        self.assertMatchesBaseline(torch.zeros(2, 48000), True)
+
+    def test_nan_is_not_silent(self):
+        self.assertMatchesBaseline(torch.full((2, 10), float("nan")), False)
+
+        audio = torch.zeros(2, 4096)
+        audio[1, 4095] = float("nan")
+        self.assertMatchesBaseline(audio, False)
+
+    def test_peak_exactly_at_threshold_is_not_silent(self):
+        self.assertMatchesBaseline(torch.ones(2, 5) * 1e-6, False)
+
+        # Off the probe grid, so the full reduction decides
+        audio = torch.zeros(2, 6400)
+        audio[0, 1] = 1e-6
+        self.assertMatchesBaseline(audio, False)
+
+    def test_fp16(self):
+        self.assertMatchesBaseline(torch.zeros(2, 100, dtype=torch.float16), True)
+        self.assertMatchesBaseline(torch.full((2, 100), 1e-6, dtype=torch.float16), False)
+        self.assertMatchesBaseline(torch.full((2, 100), 0.25, dtype=torch.float16), False)
+
+        audio = torch.zeros(2, 6400, dtype=torch.float16)
+        audio[1, 1] = 1e-6
+        self.assertMatchesBaseline(audio, False)
+
+    def test_int16(self):
+        self.assertMatchesBaseline(torch.zeros(2, 100, dtype=torch.int16), True)
+
+        audio = torch.zeros(2, 100, dtype=torch.int16)
+        audio[0, 37] = -1
+        self.assertMatchesBaseline(audio, False)
+
+    def test_empty_is_silent(self):
+        self.assertMatchesBaseline(torch.zeros(2, 0), True)
+
+    def test_spike_missed_by_strided_probe_is_found(self):
+        audio = torch.zeros(1, 2, 64000)
+        # The probe samples every 1000th frame, so index 1 is not probed
+        audio[0, 1, 1] = 0.5
+        self.assertMatchesBaseline(audio, False)
+
+    def test_spike_hit_by_strided_probe(self):
+        audio = torch.zeros(2, 64000)
+        audio[0, 1000] = 0.5
+        self.assertMatchesBaseline(audio, False)
+
+
+
+class PadSequencesTests(unittest.TestCase):
+    def setUp(self):
+        self.handler = FakeHandler()
+        self.token_ids = [torch.tensor([5, 6, 7]), torch.tensor([8]), torch.tensor([], dtype=torch.long)]
+
+    def assertMatchesBaseline(self, sequences, max_length, pad_value):
+        expected = baseline_pad_sequences(sequences, max_length, pad_value)
+        actual = self.handler._pad_sequences(sequences, max_length, pad_value)
+
+        self.assertEqual(actual.dtype, expected.dtype)
+        self.assertTrue(torch.equal(actual, expected), f"{actual} != {expected}")
+
+    def test_pads_to_longest(self):
+        self.assertMatchesBaseline(self.token_ids, 3, 1)
+
+    def test_pads_beyond_longest(self):
+        self.assertMatchesBaseline(self.token_ids, 6, 1)
+
+    def test_truncates_to_max_length(self):
+        self.assertMatchesBaseline(self.token_ids, 2, 1)
+
+    def test_bool_attention_masks(self):
+        masks = [torch.ones(3, dtype=torch.bool), torch.ones(1, dtype=torch.bool)]
+
+        self.assertMatchesBaseline(masks, 5, 0)
+        self.assertMatchesBaseline(masks, 2, 0)
+
+    def test_none_pad_value_pads_with_zero(self):
+        self.assertMatchesBaseline(self.token_ids, 5, None)
+        self.assertMatchesBaseline(self.token_ids, 2, None)
+
+    def test_cpu_handler_does_not_pin(self):
+        self.assertFalse(self.handler._pad_sequences(self.token_ids, 4, 0).is_pinned())
+
+
+if __name__ == "__main__":
+    unittest.main()
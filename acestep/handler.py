@@ -44,7 +44,8 @@ from acestep.constants import (
     SFT_GEN_PROMPT,
     DEFAULT_DIT_INSTRUCTION,
 )
-from acestep.core.generation.handler import LoraManagerMixin, ProgressMixin
+from acestep.core.audio.resample import get_resampler
+from acestep.core.generation.handler import InputsMixin, LoraManagerMixin, ProgressMixin, TensorOpsMixin
 from acestep.dit_alignment_score import MusicStampsAligner, MusicLyricScorer
 from acestep.gpu_config import get_gpu_memory_gb, get_global_gpu_config, get_effective_free_vram_gb
 
@@ -52,7 +53,7 @@ from acestep.gpu_config import get_gpu_memory_gb, get_global_gpu_config, get_eff
 warnings.filterwarnings("ignore")
 
 
-class AceStepHandler(LoraManagerMixin, ProgressMixin):
+class AceStepHandler(InputsMixin, TensorOpsMixin, LoraManagerMixin, ProgressMixin):
     """ACE-Step Business Logic Handler"""
     
     def __init__(self):
@@ -907,64 +908,6 @@ class AceStepHandler(LoraManagerMixin, ProgressMixin):
             lm_hints_25hz = detokenizer(quantized)
             return lm_hints_25hz
     
-    def _create_default_meta(self) -> str:
-        """Create default metadata string."""
-        return (
-            "- bpm: N/A\n"
-            "- timesignature: N/A\n" 
-            "- keyscale: N/A\n"
-            "- duration: 30 seconds\n"
-        )
-    
-    def _dict_to_meta_string(self, meta_dict: Dict[str, Any]) -> str:
-        """Convert metadata dict to formatted string."""
-        bpm = meta_dict.get('bpm', meta_dict.get('tempo', 'N/A'))
-        timesignature = meta_dict.get('timesignature', meta_dict.get('time_signature', 'N/A'))
-        keyscale = meta_dict.get('keyscale', meta_dict.get('key', meta_dict.get('scale', 'N/A')))
-        duration = meta_dict.get('duration', meta_dict.get('length', 30))
-
-        # Format duration
-        if isinstance(duration, (int, float)):
-            duration = f"{int(duration)} seconds"
-        elif not isinstance(duration, str):
-            duration = "30 seconds"
-        
-        return (
-            f"- bpm: {bpm}\n"
-            f"- timesignature: {timesignature}\n"
-            f"- keyscale: {keyscale}\n"
-            f"- duration: {duration}\n"
-        )
-    
-    def _parse_metas(self, metas: List[Union[str, Dict[str, Any]]]) -> List[str]:
-        """
-        Parse and normalize metadata with fallbacks.
-        
-        Args:
-            metas: List of metadata (can be strings, dicts, or None)
-            
-        Returns:
-            List of formatted metadata strings
-        """
-        parsed_metas = []
-        for meta in metas:
-            if meta is None:
-                # Default fallback metadata
-                parsed_meta = self._create_default_meta()
-            elif isinstance(meta, str):
-                # Already formatted string
-                parsed_meta = meta
-            elif isinstance(meta, dict):
-                # Convert dict to formatted string
-                parsed_meta = self._dict_to_meta_string(meta)
-            else:
-                # Fallback for any other type
-                parsed_meta = self._create_default_meta()
-            
-            parsed_metas.append(parsed_meta)
-        
-        return parsed_metas
-    
     def build_dit_inputs(
         self,
         task: str,
@@ -1143,9 +1086,6 @@ class AceStepHandler(LoraManagerMixin, ProgressMixin):
         """Build metadata dict - use "N/A" as default for empty fields."""
         return self._build_metadata_dict(bpm, key_scale, time_signature)
     
-    def is_silence(self, audio):
-        return torch.all(audio.abs() < 1e-6)
-    
     def _empty_cache(self) -> None:
         """Clear device cache to reduce peak memory usage."""
         if self.device.startswith("cuda") and torch.cuda.is_available():
@@ -1367,9 +1307,7 @@ class AceStepHandler(LoraManagerMixin, ProgressMixin):
     
     def _format_instruction(self, instruction: str) -> str:
         """Format instruction to ensure it ends with colon."""
-        if not instruction.endswith(":"):
-            instruction = instruction + ":"
-        return instruction
+        return instruction if instruction.endswith(":") else instruction + ":"
     
     def _normalize_audio_to_stereo_48k(self, audio: torch.Tensor, sr: int) -> torch.Tensor:
         """
@@ -1380,96 +1318,47 @@ class AceStepHandler(LoraManagerMixin, ProgressMixin):
             sr: Sample rate
             
         Returns:
-            Normalized audio tensor [2, samples] at 48kHz
+            Normalized contiguous audio tensor [2, samples] at 48kHz
         """
-        # Convert to stereo (duplicate channel if mono)
-        if audio.shape[0] == 1:
-            audio = torch.cat([audio, audio], dim=0)
-        
-        # Keep only first 2 channels
+        # Keep only first 2 channels before resampling so extra channels cost nothing
         audio = audio[:2]
         
-        # Resample to 48kHz if needed
+        # Resample to 48kHz if needed (mono is resampled once, before duplication)
         if sr != 48000:
-            audio = torchaudio.transforms.Resample(sr, 48000)(audio)
+            # float64 gives no quality benefit for resampling and doubles memory traffic
+            if audio.dtype == torch.float64:
+                audio = audio.float()
+            audio = get_resampler(sr, 48000, audio.device, audio.dtype)(audio)
+        
+        # Convert to stereo (duplicate channel if mono).
+        # expand() is a zero-copy view; the clamp below materializes it.
+        if audio.shape[0] == 1:
+            audio = audio.expand(2, audio.shape[1])
         
         # Clamp values to [-1.0, 1.0]
         audio = torch.clamp(audio, -1.0, 1.0)
         
-        return audio
-    
-    def _normalize_audio_code_hints(self, audio_code_hints: Optional[Union[str, List[str]]], batch_size: int) -> List[Optional[str]]:
-        """Normalize audio_code_hints to list of correct length."""
-        if audio_code_hints is None:
-            normalized = [None] * batch_size
-        elif isinstance(audio_code_hints, str):
-            normalized = [audio_code_hints] * batch_size
-        elif len(audio_code_hints) == 1 and batch_size > 1:
-            normalized = audio_code_hints * batch_size
-        elif len(audio_code_hints) != batch_size:
-            # Pad or truncate to match batch_size
-            normalized = list(audio_code_hints[:batch_size])
-            while len(normalized) < batch_size:
-                normalized.append(None)
-        else:
-            normalized = list(audio_code_hints)
-        
-        # Clean up: convert empty strings to None
-        normalized = [hint if isinstance(hint, str) and hint.strip() else None for hint in normalized]
-        return normalized
-    
-    def _normalize_instructions(self, instructions: Optional[Union[str, List[str]]], batch_size: int, default: Optional[str] = None) -> List[str]:
-        """Normalize instructions to list of correct length."""
-        if instructions is None:
-            default_instruction = default or DEFAULT_DIT_INSTRUCTION
-            return [default_instruction] * batch_size
-        elif isinstance(instructions, str):
-            return [instructions] * batch_size
-        elif len(instructions) == 1:
-            return instructions * batch_size
-        elif len(instructions) != batch_size:
-            # Pad or truncate to match batch_size
-            normalized = list(instructions[:batch_size])
-            default_instruction = default or DEFAULT_DIT_INSTRUCTION
-            while len(normalized) < batch_size:
-                normalized.append(default_instruction)
-            return normalized
-        else:
-            return list(instructions)
+        # Guarantee a dense layout at the module boundary (no-op when clamp already produced one)
+        # so downstream encoders never hit a hidden .contiguous() copy in the hot path
+        return audio.contiguous()
     
     def _format_lyrics(self, lyrics: str, language: str) -> str:
         """Format lyrics text with language header."""
         return f"# Languages\n{language}\n\n# Lyric\n{lyrics}<|endoftext|>"
     
-    def _pad_sequences(self, sequences: List[torch.Tensor], max_length: int, pad_value: int = 0) -> torch.Tensor:
-        """Pad sequences to same length."""
-        return torch.stack([
-            torch.nn.functional.pad(seq, (0, max_length - len(seq)), 'constant', pad_value)
-            for seq in sequences
-        ])
-    
     def _extract_caption_and_language(self, metas: List[Union[str, Dict[str, Any]]], captions: List[str], vocal_languages: List[str]) -> Tuple[List[str], List[str]]:
         """Extract caption and language from metas with fallback to provided values."""
         actual_captions = list(captions)
         actual_languages = list(vocal_languages)
         
-        for i, meta in enumerate(metas):
-            if i >= len(actual_captions):
-                break
-                
-            meta_dict = None
-            if isinstance(meta, str):
-                parsed = self._parse_metas([meta])
-                if parsed and isinstance(parsed[0], dict):
-                    meta_dict = parsed[0]
-            elif isinstance(meta, dict):
-                meta_dict = meta
-            
-            if meta_dict:
-                if 'caption' in meta_dict and meta_dict['caption']:
-                    actual_captions[i] = str(meta_dict['caption'])
-                if 'language' in meta_dict and meta_dict['language']:
-                    actual_languages[i] = str(meta_dict['language'])
+        # _parse_metas returns strings unchanged, so only dict metas can carry overrides
+        for i, meta in enumerate(metas[:len(actual_captions)]):
+            if not isinstance(meta, dict):
+                continue
+            if meta.get('caption'):
+                actual_captions[i] = str(meta['caption'])
+            if meta.get('language'):
+                actual_languages[i] = str(meta['language'])
         
         return actual_captions, actual_languages
     
@@ -2327,7 +2216,7 @@ class AceStepHandler(LoraManagerMixin, ProgressMixin):
         # to device
         for k, v in batch.items():
             if isinstance(v, torch.Tensor):
-                batch[k] = v.to(self.device)
+                batch[k] = v.to(self.device, non_blocking=v.is_pinned())
                 if torch.is_floating_point(v):
                     batch[k] = v.to(self.dtype)
         return batch